@@ -278,21 +278,30 @@ class App(EmbedChain):
 
         try:
             self._upload_data_to_pipeline(data_type, data_value, metadata)
-            self._mark_data_as_uploaded(data_hash)
             return True
         except Exception:
             print(f"❌ Error occurred during data upload for hash {data_hash}!")
             return False
 
-    def _mark_data_as_uploaded(self, data_hash):
-        self.db_session.query(DataSource).filter_by(hash=data_hash, app_id=self.local_id).update({"is_uploaded": 1})
+    def _mark_data_as_uploaded(self, data_hashes):
+        self.db_session.query(DataSource).filter(
+            DataSource.app_id == self.local_id, DataSource.hash.in_(data_hashes)
+        ).update({"is_uploaded": 1}, synchronize_session=False)
+        try:
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Error marking data sources as uploaded: {e}")
+            self.db_session.rollback()
 
     def get_data_sources(self):
-        data_sources = self.db_session.query(DataSource).filter_by(app_id=self.local_id).all()
-        results = []
-        for row in data_sources:
-            results.append({"data_type": row.type, "data_value": row.value, "metadata": row.meta_data})
-        return results
+        # Only load the returned columns instead of full `DataSource` instances
+        data_sources = self.db_session.query(DataSource.type, DataSource.value, DataSource.meta_data).filter_by(
+            app_id=self.local_id
+        )
+        return [
+            {"data_type": data_type, "data_value": data_value, "metadata": metadata}
+            for data_type, data_value, metadata in data_sources
+        ]
 
     def deploy(self):
         if self.client is None:
@@ -301,12 +310,23 @@ class App(EmbedChain):
         pipeline_data = self._create_pipeline()
         self.id = pipeline_data["id"]
 
-        results = self.db_session.query(DataSource).filter_by(app_id=self.local_id, is_uploaded=0).all()
+        results = (
+            self.db_session.query(DataSource.hash, DataSource.type, DataSource.value)
+            .filter_by(app_id=self.local_id, is_uploaded=0)
+            .all()
+        )
         if len(results) > 0:
             print("🛠️ Adding data to your pipeline...")
-        for result in results:
-            data_hash, data_type, data_value = result.hash, result.data_type, result.data_value
-            self._process_and_upload_data(data_hash, data_type, data_value)
+        uploaded_hashes = []
+        try:
+            for data_hash, data_type, data_value in results:
+                if self._process_and_upload_data(data_hash, data_type, data_value):
+                    uploaded_hashes.append(data_hash)
+        finally:
+            # Mark the uploaded data sources with a single update, even if a later upload raised,
+            # so that they are not uploaded again on the next deploy
+            if uploaded_hashes:
+                self._mark_data_as_uploaded(uploaded_hashes)
 
         # Send anonymous telemetry
         self.telemetry.capture(event_name="deploy", properties=self._telemetry_props)
@@ -13,6 +13,7 @@ class ElasticsearchDBConfig(BaseVectorDbConfig):
         dir: Optional[str] = None,
         es_url: Union[str, list[str]] = None,
         cloud_id: Optional[str] = None,
+        index_options: Optional[dict[str, any]] = None,
         **ES_EXTRA_PARAMS: dict[str, any],
     ):
         """
@@ -24,6 +25,9 @@ class ElasticsearchDBConfig(BaseVectorDbConfig):
         :type dir: Optional[str], optional
         :param es_url: elasticsearch url or list of nodes url to be used for connection, defaults to None
         :type es_url: Union[str, list[str]], optional
+        :param index_options: `index_options` of the embeddings field for newly created indices,
+        e.g. `{"type": "int8_hnsw"}` to store the vector index with int8 quantization, defaults to None
+        :type index_options: Optional[dict[str, any]], optional
         :param ES_EXTRA_PARAMS: extra params dict that can be passed to elasticsearch.
         :type ES_EXTRA_PARAMS: dict[str, Any], optional
         """
@@ -37,6 +41,7 @@ class ElasticsearchDBConfig(BaseVectorDbConfig):
                 "Elasticsearch needs a URL or CLOUD_ID attribute, "
                 "this can either be passed to `ElasticsearchDBConfig` or as `ELASTICSEARCH_URL` or `ELASTICSEARCH_CLOUD_ID` in `.env`"  # noqa: E501
             )
+        self.index_options = index_options
         self.ES_EXTRA_PARAMS = ES_EXTRA_PARAMS
         # Load API key from .env if it's not explicitly passed.
         # Can only set one of 'api_key', 'basic_auth', and 'bearer_auth'
@@ -1,3 +1,4 @@
+import concurrent.futures
 import hashlib
 import json
 import logging
@@ -224,7 +225,17 @@ class EmbedChain(JSONSerializable):
 
         return source_hash
 
-    def _get_existing_doc_id(self, chunker: BaseChunker, src: Any):
+    @staticmethod
+    def _get_source_url(chunker: BaseChunker, src: Any) -> Any:
+        """
+        Get the `url` stored in the metadata of the chunks of a source.
+        JSON strings are referenced by their sha256 hash instead of their content.
+        """
+        if chunker.data_type == DataType.JSON and is_valid_json_string(src):
+            return hashlib.sha256((src).encode("utf-8")).hexdigest()
+        return src
+
+    def _get_existing_doc_id(self, chunker: BaseChunker, src: Any, source_url: Any):
         """
         Get id of existing document for a given source, based on the data type
         """
@@ -239,10 +250,7 @@ class EmbedChain(JSONSerializable):
         elif chunker.data_type.value in [item.value for item in IndirectDataType]:
             # These types have an indirect source reference
             # As long as the reference is the same, they can be updated.
-            where = {"url": src}
-            if chunker.data_type == DataType.JSON and is_valid_json_string(src):
-                url = hashlib.sha256((src).encode("utf-8")).hexdigest()
-                where = {"url": url}
+            where = {"url": source_url}
 
             if self.config.id is not None:
                 where.update({"app_id": self.config.id})
@@ -313,7 +321,9 @@ class EmbedChain(JSONSerializable):
         :type dry_run: bool, defaults to False
         :return: (list) documents (embedded text), (list) metadata, (list) ids, (int) number of chunks
         """
-        existing_doc_id = self._get_existing_doc_id(chunker=chunker, src=src)
+        # Validating and hashing JSON sources is not cheap, so it's only done once per source.
+        source_url = self._get_source_url(chunker, src)
+        existing_doc_id = self._get_existing_doc_id(chunker=chunker, src=src, source_url=source_url)
         app_id = self.config.id if self.config is not None else None
 
         # Create chunks
@@ -333,11 +343,12 @@ class EmbedChain(JSONSerializable):
             logger.info("Doc content has changed. Recomputing chunks and embeddings intelligently.")
             self.db.delete({"doc_id": existing_doc_id})
 
+        if not documents:
+            logger.info(f"No chunks created from {str(src)[:100]} ({chunker.data_type}). Skipping embeddings.")
+            return [], [], [], 0
+
         # get existing ids, and discard doc if any common id exist.
-        where = {"url": src}
-        if chunker.data_type == DataType.JSON and is_valid_json_string(src):
-            url = hashlib.sha256((src).encode("utf-8")).hexdigest()
-            where = {"url": url}
+        where = {"url": source_url}
 
         # if data type is qna_pair, we check for question
         if chunker.data_type == DataType.QNA_PAIR:
@@ -349,10 +360,14 @@ class EmbedChain(JSONSerializable):
         db_result = self.db.get(ids=ids, where=where)  # optional filter
         existing_ids = set(db_result["ids"])
         if len(existing_ids):
-            data_dict = {id: (doc, meta) for id, doc, meta in zip(ids, documents, metadatas)}
-            data_dict = {id: value for id, value in data_dict.items() if id not in existing_ids}
-
-            if not data_dict:
+            # Drop the chunks that already exist in a single pass, keeping the order of the remaining ones.
+            new_data = [
+                (id, doc, meta)
+                for id, doc, meta in zip(ids, documents, metadatas)
+                if not (id in existing_ids or existing_ids.add(id))
+            ]
+
+            if not new_data:
                 src_copy = src
                 if len(src_copy) > 50:
                     src_copy = src[:50] + "..."
@@ -360,8 +375,7 @@ class EmbedChain(JSONSerializable):
                 # Make sure to return a matching return type
                 return [], [], [], 0
 
-            ids = list(data_dict.keys())
-            documents, metadatas = zip(*data_dict.values())
+            ids, documents, metadatas = (list(values) for values in zip(*new_data))
 
         # Loop though all metadatas and add extras.
         new_metadatas = []
@@ -467,6 +481,47 @@ class EmbedChain(JSONSerializable):
 
         return contexts
 
+    def _retrieve_with_web_search(
+        self,
+        input_query: str,
+        config: Optional[BaseLlmConfig] = None,
+        where=None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> tuple[Union[list[tuple[str, str, str]], list[str]], Optional[str]]:
+        """
+        Queries the vector database based on the given input query and, if the llm is `online`,
+        searches the web for the same query.
+
+        Both only depend on the input query, so the web search runs concurrently with the
+        database retrieval instead of after it. When the cache is enabled, the web search is left
+        to the llm, so that it only runs when there is no cached answer.
+
+        :param input_query: The query to use.
+        :type input_query: str
+        :param config: The query configuration, defaults to None
+        :type config: Optional[BaseLlmConfig], optional
+        :param where: A dictionary of key-value pairs to filter the database results, defaults to None
+        :type where: _type_, optional
+        :param citations: A boolean to indicate if db should fetch citation source
+        :type citations: bool
+        :return: Contents of the documents that matched your query and the web search result,
+        which is None if the llm is not `online` or the cache is enabled
+        :rtype: tuple[list[str], Optional[str]]
+        """
+        if self.cache_config is not None or not (config or self.llm.config).online:
+            contexts = self._retrieve_from_database(
+                input_query=input_query, config=config, where=where, citations=citations, **kwargs
+            )
+            return contexts, None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            web_search_future = executor.submit(self.llm.access_search_and_get_results, input_query)
+            contexts = self._retrieve_from_database(
+                input_query=input_query, config=config, where=where, citations=citations, **kwargs
+            )
+            return contexts, web_search_future.result()
+
     def query(
         self,
         input_query: str,
@@ -500,7 +555,7 @@ class EmbedChain(JSONSerializable):
         or the dry run result
         :rtype: str, if citations is False, otherwise tuple[str, list[tuple[str,str,str]]]
         """
-        contexts = self._retrieve_from_database(
+        contexts, web_search_result = self._retrieve_with_web_search(
             input_query=input_query, config=config, where=where, citations=citations, **kwargs
         )
         if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
@@ -522,7 +577,11 @@ class EmbedChain(JSONSerializable):
             )
         else:
             answer = self.llm.query(
-                input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
+                input_query=input_query,
+                contexts=contexts_data_for_llm_query,
+                config=config,
+                dry_run=dry_run,
+                web_search_result=web_search_result,
             )
 
         # Send anonymous telemetry
@@ -571,7 +630,7 @@ class EmbedChain(JSONSerializable):
         or the dry run result
         :rtype: str, if citations is False, otherwise tuple[str, list[tuple[str,str,str]]]
         """
-        contexts = self._retrieve_from_database(
+        contexts, web_search_result = self._retrieve_with_web_search(
             input_query=input_query, config=config, where=where, citations=citations, **kwargs
         )
         if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
@@ -598,7 +657,11 @@ class EmbedChain(JSONSerializable):
         else:
             logger.debug("Cache disabled. Running chat without cache.")
             answer = self.llm.chat(
-                input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
+                input_query=input_query,
+                contexts=contexts_data_for_llm_query,
+                config=config,
+                dry_run=dry_run,
+                web_search_result=web_search_result,
             )
 
         # add conversation in memory
@@ -1,4 +1,6 @@
+from array import array
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, Optional
 
 from embedchain.config.embedder.base import BaseEmbedderConfig
@@ -28,6 +30,10 @@ class BaseEmbedder:
     To manually overwrite you can use this classes `set_...` methods.
     """
 
+    # Maximum number of query strings whose embeddings are kept in memory by `to_embeddings`.
+    # A cached 1536 dimensional embedding takes about 12 KB.
+    EMBEDDINGS_CACHE_SIZE = 256
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         """
         Initialize the embedder class.
@@ -40,6 +46,7 @@ class BaseEmbedder:
         else:
             self.config = config
         self.vector_dimension: int
+        self._cached_embedding = lru_cache(maxsize=self.EMBEDDINGS_CACHE_SIZE)(self._embed)
 
     def set_embedding_fn(self, embedding_fn: Callable[[list[str]], list[str]]):
         """
@@ -52,6 +59,8 @@ class BaseEmbedder:
         if not hasattr(embedding_fn, "__call__"):
             raise ValueError("Embedding function is not a function")
         self.embedding_fn = embedding_fn
+        # Embeddings cached so far were computed by the previous function.
+        self._cached_embedding.cache_clear()
 
     def set_vector_dimension(self, vector_dimension: int):
         """
@@ -77,14 +86,23 @@ class BaseEmbedder:
 
         return EmbeddingFunc(embeddings.embed_documents)
 
+    def _embed(self, data: str) -> array:
+        # Packed doubles take a quarter of the memory of a tuple of floats, without losing precision.
+        return array("d", self.embedding_fn([data])[0])
+
     def to_embeddings(self, data: str, **_):
         """
         Convert data to embeddings
 
+        Embeddings of recently converted strings are cached, so the same query embedded by the
+        cache layer and the vector database only calls the embedding function once.
+        ChromaDB, the default vector database, embeds queries itself and doesn't use this method.
+
         :param data: data to convert to embeddings
         :type data: str
         :return: embeddings
         :rtype: list[float]
         """
-        embeddings = self.embedding_fn([data])
-        return embeddings[0]
+        if not isinstance(data, str):
+            return self.embedding_fn([data])[0]
+        return list(self._cached_embedding(data))
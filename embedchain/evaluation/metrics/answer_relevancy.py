@@ -50,11 +50,17 @@ class AnswerRelevance(BaseMetric):
         """
         Generates the embedding for a question.
         """
+        return self._generate_embeddings([question])[0]
+
+    def _generate_embeddings(self, texts: list[str]) -> np.ndarray:
+        """
+        Generates embeddings for multiple texts with a single request.
+        """
         response = self.client.embeddings.create(
-            input=question,
+            input=texts,
             model=self.config.embedder,
         )
-        return np.array(response.data[0].embedding)
+        return np.array([data.embedding for data in response.data])
 
     def _compute_similarity(self, original: np.ndarray, generated: np.ndarray) -> float:
         """
@@ -70,8 +76,9 @@ class AnswerRelevance(BaseMetric):
         """
         prompt = self._generate_prompt(data)
         generated_questions = self._generate_questions(prompt)
-        original_embedding = self._generate_embedding(data.question)
-        generated_embeddings = np.array([self._generate_embedding(q) for q in generated_questions])
+        # Embed the original and generated questions together to avoid one request per question.
+        embeddings = self._generate_embeddings([data.question, *generated_questions])
+        original_embedding, generated_embeddings = embeddings[0], embeddings[1:]
         similarities = self._compute_similarity(original_embedding, generated_embeddings)
         return np.mean(similarities)
 
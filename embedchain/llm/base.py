@@ -94,13 +94,10 @@ class BaseLlm(JSONSerializable):
             prompt = self.config.prompt.substitute(
                 context=context_string, query=input_query, history=self._format_history() or "No history"
             )
-        elif self.history and not prompt_contains_history:
+        elif self.history:
             # History is present, but not included in the prompt.
             # check if it's the default prompt without history
-            if (
-                not self.config._validate_prompt_history(self.config.prompt)
-                and self.config.prompt.template == DEFAULT_PROMPT
-            ):
+            if self.config.prompt.template == DEFAULT_PROMPT:
                 # swap in the template with history
                 prompt = DEFAULT_PROMPT_WITH_HISTORY_TEMPLATE.substitute(
                     context=context_string, query=input_query, history=self._format_history()
@@ -176,7 +173,14 @@ class BaseLlm(JSONSerializable):
             yield chunk
         logger.info(f"Answer: {streamed_answer}")
 
-    def query(self, input_query: str, contexts: list[str], config: BaseLlmConfig = None, dry_run=False):
+    def query(
+        self,
+        input_query: str,
+        contexts: list[str],
+        config: BaseLlmConfig = None,
+        dry_run=False,
+        web_search_result: Optional[str] = None,
+    ):
         """
         Queries the vector database based on the given input query.
         Gets relevant doc based on the query and then passes it to an
@@ -192,6 +196,9 @@ class BaseLlm(JSONSerializable):
         :param dry_run: A dry run does everything except send the resulting prompt to
         the LLM. The purpose is to test the prompt, not the response., defaults to False
         :type dry_run: bool, optional
+        :param web_search_result: Web search result to use if `online` is enabled. The web is searched
+        if it is not provided, defaults to None
+        :type web_search_result: Optional[str], optional
         :return: The answer to the query or the dry run result
         :rtype: str
         """
@@ -211,7 +218,9 @@ class BaseLlm(JSONSerializable):
                 self.config.number_documents = 5
             k = {}
             if self.config.online:
-                k["web_search_result"] = self.access_search_and_get_results(input_query)
+                if web_search_result is None:
+                    web_search_result = self.access_search_and_get_results(input_query)
+                k["web_search_result"] = web_search_result
             prompt = self.generate_prompt(input_query, contexts, **k)
             logger.info(f"Prompt: {prompt}")
             if dry_run:
@@ -229,7 +238,13 @@ class BaseLlm(JSONSerializable):
                 self.config: BaseLlmConfig = BaseLlmConfig.deserialize(prev_config)
 
     def chat(
-        self, input_query: str, contexts: list[str], config: BaseLlmConfig = None, dry_run=False, session_id: str = None
+        self,
+        input_query: str,
+        contexts: list[str],
+        config: BaseLlmConfig = None,
+        dry_run=False,
+        session_id: str = None,
+        web_search_result: Optional[str] = None,
     ):
         """
         Queries the vector database on the given input query.
@@ -250,6 +265,9 @@ class BaseLlm(JSONSerializable):
         :type dry_run: bool, optional
         :param session_id: Session ID to use for the conversation, defaults to None
         :type session_id: str, optional
+        :param web_search_result: Web search result to use if `online` is enabled. The web is searched
+        if it is not provided, defaults to None
+        :type web_search_result: Optional[str], optional
         :return: The answer to the query or the dry run result
         :rtype: str
         """
@@ -266,7 +284,9 @@ class BaseLlm(JSONSerializable):
                 self.config.number_documents = 5
             k = {}
             if self.config.online:
-                k["web_search_result"] = self.access_search_and_get_results(input_query)
+                if web_search_result is None:
+                    web_search_result = self.access_search_and_get_results(input_query)
+                k["web_search_result"] = web_search_result
 
             prompt = self.generate_prompt(input_query, contexts, **k)
             logger.info(f"Prompt: {prompt}")
@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Optional, Union
 
+import numpy as np
+
 try:
     from elasticsearch import Elasticsearch
     from elasticsearch.helpers import bulk
@@ -57,6 +59,9 @@ class ElasticsearchDB(BaseVectorDB):
                 "Something is wrong with your config. Please check again - `https://docs.embedchain.ai/components/vector-databases#elasticsearch`"  # noqa: E501
             )
 
+        # Whether the embeddings of an index are stored in a vector index, by index name
+        self._knn_enabled: dict[str, bool] = {}
+
         # Call parent init here because embedder is needed
         super().__init__(config=self.config)
 
@@ -69,15 +74,26 @@ class ElasticsearchDB(BaseVectorDB):
             "mappings": {
                 "properties": {
                     "text": {"type": "text"},
-                    "embeddings": {"type": "dense_vector", "index": False, "dims": self.embedder.vector_dimension},
+                    "embeddings": {
+                        "type": "dense_vector",
+                        "index": True,
+                        # Embeddings are normalized before they are stored, so the dot product equals
+                        # the cosine similarity without computing the vector magnitudes on every search.
+                        "similarity": "dot_product",
+                        "dims": self.embedder.vector_dimension,
+                    },
                 }
             }
         }
+        if self.config.index_options:
+            # e.g. int8 quantization of the vector index, see the `index_options` of `dense_vector` fields
+            index_settings["mappings"]["properties"]["embeddings"]["index_options"] = self.config.index_options
         es_index = self._get_index()
         if not self.client.indices.exists(index=es_index):
             # create index if not exist
             print("Creating index", es_index, index_settings)
             self.client.indices.create(index=es_index, body=index_settings)
+            self._knn_enabled[es_index] = True
 
     def _get_or_create_db(self):
         """Called during initialization"""
@@ -106,7 +122,7 @@ class ElasticsearchDB(BaseVectorDB):
             for key, value in where.items():
                 query["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
 
-        response = self.client.search(index=self._get_index(), query=query, _source=True, size=limit)
+        response = self.client.search(index=self._get_index(), query=query, _source=["metadata.doc_id"], size=limit)
         docs = response["hits"]["hits"]
         ids = [doc["_id"] for doc in docs]
         doc_ids = [doc["_source"]["metadata"]["doc_id"] for doc in docs]
@@ -137,28 +153,19 @@ class ElasticsearchDB(BaseVectorDB):
         :type ids: list[str]
         """
 
-        embeddings = self.embedder.embedding_fn(documents)
-
-        for chunk in chunks(
-            list(zip(ids, documents, metadatas, embeddings)), self.BATCH_SIZE, desc="Inserting batches in elasticsearch"
-        ):  # noqa: E501
-            ids, docs, metadatas, embeddings = [], [], [], []
-            for id, text, metadata, embedding in chunk:
-                ids.append(id)
-                docs.append(text)
-                metadatas.append(metadata)
-                embeddings.append(embedding)
-
-            batch_docs = []
-            for id, text, metadata, embedding in zip(ids, docs, metadatas, embeddings):
-                batch_docs.append(
-                    {
-                        "_index": self._get_index(),
-                        "_id": id,
-                        "_source": {"text": text, "metadata": metadata, "embeddings": embedding},
-                    }
-                )
-            bulk(self.client, batch_docs, **kwargs)
+        embeddings = self._normalize(self.embedder.embedding_fn(documents))
+
+        es_index = self._get_index()
+        actions = [
+            {
+                "_index": es_index,
+                "_id": id,
+                "_source": {"text": text, "metadata": metadata, "embeddings": embedding},
+            }
+            for id, text, metadata, embedding in zip(ids, documents, metadatas, embeddings)
+        ]
+        for chunk in chunks(actions, self.BATCH_SIZE, desc="Inserting batches in elasticsearch"):
+            bulk(self.client, chunk, **kwargs)
         self.client.indices.refresh(index=self._get_index())
 
     def query(
@@ -186,25 +193,35 @@ class ElasticsearchDB(BaseVectorDB):
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
         input_query_vector = self.embedder.embedding_fn(input_query)
-        query_vector = input_query_vector[0]
-
-        # `https://www.elastic.co/guide/en/elasticsearch/reference/7.17/query-dsl-script-score-query.html`
-        query = {
-            "script_score": {
-                "query": {"bool": {"must": [{"exists": {"field": "text"}}]}},
-                "script": {
-                    "source": "cosineSimilarity(params.input_query_vector, 'embeddings') + 1.0",
-                    "params": {"input_query_vector": query_vector},
-                },
-            }
-        }
-
-        if where:
-            for key, value in where.items():
-                query["script_score"]["query"]["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
+        query_vector = self._normalize(input_query_vector[:1])[0]
 
+        filters = [{"term": {f"metadata.{key}.keyword": value}} for key, value in (where or {}).items()]
         _source = ["text", "metadata"]
-        response = self.client.search(index=self._get_index(), query=query, _source=_source, size=n_results)
+
+        if self._is_knn_enabled():
+            # Approximate kNN search on the vector index, instead of scoring every document in the index.
+            # `https://www.elastic.co/guide/en/elasticsearch/reference/current/knn-search.html`
+            knn = {
+                "field": "embeddings",
+                "query_vector": query_vector,
+                "k": n_results,
+                # Elasticsearch rejects more than 10000 candidates per shard.
+                "num_candidates": min(max(n_results * 10, 100), 10000),
+                "filter": {"bool": {"must": filters}},
+            }
+            response = self.client.search(index=self._get_index(), knn=knn, _source=_source, size=n_results)
+        else:
+            # `https://www.elastic.co/guide/en/elasticsearch/reference/7.17/query-dsl-script-score-query.html`
+            query = {
+                "script_score": {
+                    "query": {"bool": {"must": [{"exists": {"field": "text"}}, *filters]}},
+                    "script": {
+                        "source": "cosineSimilarity(params.input_query_vector, 'embeddings') + 1.0",
+                        "params": {"input_query_vector": query_vector},
+                    },
+                }
+            }
+            response = self.client.search(index=self._get_index(), query=query, _source=_source, size=n_results)
         docs = response["hits"]["hits"]
         contexts = []
         for doc in docs:
@@ -248,6 +265,42 @@ class ElasticsearchDB(BaseVectorDB):
         if self.client.indices.exists(index=self._get_index()):
             # delete index in Es
             self.client.indices.delete(index=self._get_index())
+        self._knn_enabled.pop(self._get_index(), None)
+
+    def _is_knn_enabled(self) -> bool:
+        """
+        Check if the embeddings of the current index can be searched with kNN search.
+
+        Indices created by older versions map `embeddings` as a `dense_vector` with `index: false`,
+        Elasticsearch rejects kNN searches on those, so they are queried with a script score instead.
+        The result is cached per index, since the mapping of an existing field can't change.
+
+        :return: True if the embeddings are stored in a vector index
+        :rtype: bool
+        """
+        es_index = self._get_index()
+        if es_index not in self._knn_enabled:
+            # The response is keyed by the concrete index, which is not `es_index` when it is an alias.
+            response = self.client.indices.get_mapping(index=es_index)
+            mapping = next(iter(response.values()))["mappings"]
+            embeddings_mapping = mapping.get("properties", {}).get("embeddings", {})
+            self._knn_enabled[es_index] = bool(embeddings_mapping.get("index", False))
+        return self._knn_enabled[es_index]
+
+    @staticmethod
+    def _normalize(embeddings: list[list[float]]) -> list[list[float]]:
+        """
+        Scale embeddings to unit length, as required by the `dot_product` similarity.
+
+        :param embeddings: list of embeddings
+        :type embeddings: list[list[float]]
+        :return: normalized embeddings
+        :rtype: list[list[float]]
+        """
+        vectors = np.asarray(embeddings, dtype=float)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1
+        return (vectors / norms).tolist()
 
     def _get_index(self) -> str:
         """Get the Elasticsearch index for a collection
@@ -264,5 +317,5 @@ class ElasticsearchDB(BaseVectorDB):
         query = {"query": {"bool": {"must": []}}}
         for key, value in where.items():
             query["query"]["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
-        self.client.delete_by_query(index=self._get_index(), body=query)
-        self.client.indices.refresh(index=self._get_index())
+        # Refresh as part of the delete request instead of sending a separate refresh request.
+        self.client.delete_by_query(index=self._get_index(), body=query, refresh=True)
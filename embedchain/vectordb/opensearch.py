@@ -46,6 +46,10 @@ class OpenSearchDB(BaseVectorDB):
         )
         info = self.client.info()
         logger.info(f"Connected to {info['version']['distribution']}. Version: {info['version']['number']}")
+        # The LangChain vector store is created on the first query and reused afterwards
+        self.docsearch = None
+        # Whether the embeddings of an index have a HNSW graph, by index name
+        self._knn_enabled: dict[str, bool] = {}
         # Remove auth credentials from config after successful connection
         super().__init__(config=self.config)
 
@@ -63,13 +67,14 @@ class OpenSearchDB(BaseVectorDB):
                     "text": {"type": "text"},
                     "embeddings": {
                         "type": "knn_vector",
-                        "index": False,
                         "dimension": self.config.vector_dimension,
+                        "method": {"name": "hnsw", "space_type": "cosinesimil", "engine": "lucene"},
                     },
                 }
             },
         }
         self.client.indices.create(index_name, body=index_body)
+        self._knn_enabled[index_name] = True
         print(self.client.indices.get(index_name))
 
     def _get_or_create_db(self):
@@ -103,7 +108,7 @@ class OpenSearchDB(BaseVectorDB):
                 query["query"]["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
 
         # OpenSearch syntax is different from Elasticsearch
-        response = self.client.search(index=self._get_index(), body=query, _source=True, size=limit)
+        response = self.client.search(index=self._get_index(), body=query, _source=["metadata.doc_id"], size=limit)
         docs = response["hits"]["hits"]
         ids = [doc["_id"] for doc in docs]
         doc_ids = [doc["_source"]["metadata"]["doc_id"] for doc in docs]
@@ -167,15 +172,7 @@ class OpenSearchDB(BaseVectorDB):
         along with url of the source and doc_id (if citations flag is true)
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
-        embeddings = OpenAIEmbeddings()
-        docsearch = OpenSearchVectorSearch(
-            index_name=self._get_index(),
-            embedding_function=embeddings,
-            opensearch_url=f"{self.config.opensearch_url}",
-            http_auth=self.config.http_auth,
-            use_ssl=hasattr(self.config, "use_ssl") and self.config.use_ssl,
-            verify_certs=hasattr(self.config, "verify_certs") and self.config.verify_certs,
-        )
+        docsearch = self._get_docsearch()
 
         pre_filter = {"match_all": {}}  # default
         if len(where) > 0:
@@ -183,15 +180,22 @@ class OpenSearchDB(BaseVectorDB):
             for key, value in where.items():
                 pre_filter["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
 
+        if self._is_knn_enabled():
+            # Approximate k-NN search on the HNSW graph, the filter is applied while searching the graph.
+            # `https://opensearch.org/docs/latest/search-plugins/knn/filter-search-knn/`
+            search_kwargs = {"search_type": "approximate_search"}
+            if len(where) > 0:
+                search_kwargs["efficient_filter"] = pre_filter
+        else:
+            search_kwargs = {"search_type": "script_scoring", "space_type": "cosinesimil", "pre_filter": pre_filter}
+
         docs = docsearch.similarity_search_with_score(
             input_query,
-            search_type="script_scoring",
-            space_type="cosinesimil",
             vector_field="embeddings",
             text_field="text",
             metadata_field="metadata",
-            pre_filter=pre_filter,
             k=n_results,
+            **search_kwargs,
             **kwargs,
         )
 
@@ -206,6 +210,25 @@ class OpenSearchDB(BaseVectorDB):
                 contexts.append(context)
         return contexts
 
+    def _get_docsearch(self) -> OpenSearchVectorSearch:
+        """
+        Get the LangChain vector store used for similarity search on the current index.
+        It holds its own OpenSearch client, so it's only created again when the index changes.
+
+        :return: OpenSearch vector store
+        :rtype: OpenSearchVectorSearch
+        """
+        if self.docsearch is None or self.docsearch.index_name != self._get_index():
+            self.docsearch = OpenSearchVectorSearch(
+                index_name=self._get_index(),
+                embedding_function=OpenAIEmbeddings(),
+                opensearch_url=f"{self.config.opensearch_url}",
+                http_auth=self.config.http_auth,
+                use_ssl=hasattr(self.config, "use_ssl") and self.config.use_ssl,
+                verify_certs=hasattr(self.config, "verify_certs") and self.config.verify_certs,
+            )
+        return self.docsearch
+
     def set_collection_name(self, name: str):
         """
         Set the name of the collection. A collection is an isolated space for vectors.
@@ -237,6 +260,27 @@ class OpenSearchDB(BaseVectorDB):
         if self.client.indices.exists(index=self._get_index()):
             # delete index in ES
             self.client.indices.delete(index=self._get_index())
+        self._knn_enabled.pop(self._get_index(), None)
+
+    def _is_knn_enabled(self) -> bool:
+        """
+        Check if the current index can be queried with approximate k-NN search.
+
+        That requires a `method` in the `knn_vector` mapping of the embeddings, which indices
+        created by older versions don't have. Their `knn_vector` fields are only usable with the
+        exact k-NN script score. The result is cached per index, as a field mapping can't be changed.
+
+        :return: True if the embeddings have a HNSW graph
+        :rtype: bool
+        """
+        index_name = self._get_index()
+        if index_name not in self._knn_enabled:
+            # The response is keyed by the concrete index, which is not `index_name` when it is an alias.
+            response = self.client.indices.get_mapping(index=index_name)
+            mapping = next(iter(response.values()))["mappings"]
+            embeddings_mapping = mapping.get("properties", {}).get("embeddings", {})
+            self._knn_enabled[index_name] = "method" in embeddings_mapping
+        return self._knn_enabled[index_name]
 
     def delete(self, where):
         """Deletes a document from the OpenSearch index"""
@@ -1,3 +1,4 @@
+import concurrent.futures
 import logging
 import os
 from typing import Optional, Union
@@ -26,6 +27,8 @@ class PineconeDB(BaseVectorDB):
     """
 
     BATCH_SIZE = 100
+    # Number of concurrent fetch requests in `get`, kept low to stay within Pinecone's rate limits
+    FETCH_MAX_WORKERS = 4
 
     def __init__(
         self,
@@ -105,12 +108,16 @@ class PineconeDB(BaseVectorDB):
 
         batch_size = 100
         if ids is not None:
-            for i in range(0, len(ids), batch_size):
-                result = self.pinecone_index.fetch(ids=ids[i : i + batch_size])
-                vectors = result.get("vectors")
-                batch_existing_ids = list(vectors.keys())
-                existing_ids.extend(batch_existing_ids)
-                metadatas.extend([vectors.get(ids).get("metadata") for ids in batch_existing_ids])
+            id_batches = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+            # Fetch the batches concurrently since each one is a separate network round-trip.
+            # `executor.map` preserves the order of the batches.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.FETCH_MAX_WORKERS) as executor:
+                results = executor.map(lambda batch: self.pinecone_index.fetch(ids=batch), id_batches)
+                for result in results:
+                    vectors = result.get("vectors")
+                    batch_existing_ids = list(vectors.keys())
+                    existing_ids.extend(batch_existing_ids)
+                    metadatas.extend([vectors.get(ids).get("metadata") for ids in batch_existing_ids])
         return {"ids": existing_ids, "metadatas": metadatas}
 
     def add(
@@ -131,11 +138,16 @@ class PineconeDB(BaseVectorDB):
         """
         docs = []
         embeddings = self.embedder.embedding_fn(documents)
-        for id, text, metadata, embedding in zip(ids, documents, metadatas, embeddings):
-            # Insert sparse vectors as well if the user wants to do the hybrid search
-            sparse_vector_dict = (
-                {"sparse_values": self.bm25_encoder.encode_documents(text)} if self.bm25_encoder else {}
-            )
+        # Insert sparse vectors as well if the user wants to do the hybrid search.
+        # The encoder tokenizes the whole batch in one call instead of once per document.
+        sparse_vector_dicts = (
+            [{"sparse_values": sparse_vector} for sparse_vector in self.bm25_encoder.encode_documents(documents)]
+            if self.bm25_encoder
+            else [{}] * len(documents)
+        )
+        for id, text, metadata, embedding, sparse_vector_dict in zip(
+            ids, documents, metadatas, embeddings, sparse_vector_dicts
+        ):
             docs.append(
                 {
                     "id": id,
@@ -176,7 +188,7 @@ class PineconeDB(BaseVectorDB):
         if app_id:
             query_filter["app_id"] = {"$eq": app_id}
 
-        query_vector = self.embedder.embedding_fn([input_query])[0]
+        query_vector = self.embedder.to_embeddings(input_query)
         params = {
             "vector": query_vector,
             "filter": query_filter,
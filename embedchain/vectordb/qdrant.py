@@ -22,6 +22,7 @@ class QdrantDB(BaseVectorDB):
     """
 
     BATCH_SIZE = 10
+    PAYLOAD_INDEX_FIELDS = ["identifier", "metadata.doc_id", "metadata.app_id", "metadata.hash", "metadata.url"]
 
     def __init__(self, config: QdrantDBConfig = None):
         """
@@ -62,6 +63,13 @@ class QdrantDB(BaseVectorDB):
                     on_disk=self.config.on_disk,
                 ),
             )
+            # Index the payload fields used in filters, so that lookups don't scan every point.
+            for field_name in self.PAYLOAD_INDEX_FIELDS:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                )
 
     def _get_or_create_db(self):
         return self.client
@@ -108,6 +116,10 @@ class QdrantDB(BaseVectorDB):
                     )
                 )
 
+        # Request everything we are looking for in one page instead of scrolling `BATCH_SIZE` points per
+        # round-trip. A lookup for N ids or for the first `limit` matches then takes a single request.
+        page_size = limit or max(len(ids or []), self.BATCH_SIZE)
+
         offset = 0
         existing_ids = []
         metadatas = []
@@ -116,13 +128,16 @@ class QdrantDB(BaseVectorDB):
                 collection_name=self.collection_name,
                 scroll_filter=models.Filter(must=qdrant_must_filters),
                 offset=offset,
-                limit=self.BATCH_SIZE,
+                limit=page_size,
             )
             offset = response[1]
             for doc in response[0]:
                 existing_ids.append(doc.payload["identifier"])
                 metadatas.append(doc.payload["metadata"])
-        return {"ids": existing_ids, "metadatas": metadatas}
+
+            if limit is not None and len(existing_ids) >= limit:
+                break
+        return {"ids": existing_ids[:limit], "metadatas": metadatas[:limit]}
 
     def add(
         self,
@@ -181,7 +196,7 @@ class QdrantDB(BaseVectorDB):
         along with url of the source and doc_id (if citations flag is true)
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
-        query_vector = self.embedder.embedding_fn([input_query])[0]
+        query_vector = self.embedder.to_embeddings(input_query)
         keys = set(where.keys() if where is not None else set())
 
         qdrant_must_filters = []
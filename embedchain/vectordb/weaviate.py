@@ -235,7 +235,7 @@ class WeaviateDB(BaseVectorDB):
         along with url of the source and doc_id (if citations flag is true)
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
-        query_vector = self.embedder.embedding_fn([input_query])[0]
+        query_vector = self.embedder.to_embeddings(input_query)
         keys = set(where.keys() if where is not None else set())
         data_fields = ["text"]
         query_metadata_keys = self.metadata_keys.union(keys)
@@ -3,6 +3,7 @@ from typing import Any, Optional, Union
 
 from embedchain.config import ZillizDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
+from embedchain.utils.misc import chunks
 from embedchain.vectordb.base import BaseVectorDB
 
 try:
@@ -20,6 +21,8 @@ logger = logging.getLogger(__name__)
 class ZillizVectorDB(BaseVectorDB):
     """Base class for vector database."""
 
+    BATCH_SIZE = 100
+
     def __init__(self, config: ZillizDBConfig = None):
         """Initialize the database. Save the config and client as an attribute.
 
@@ -111,7 +114,10 @@ class ZillizVectorDB(BaseVectorDB):
                 filter_ += " and "
             filter_ = f"{self._generate_zilliz_filter(where)}"
 
-        results = self.client.query(collection_name=self.config.collection_name, filter=filter_, output_fields=["*"])
+        # Only fetch the fields that are returned, the embeddings are by far the largest part of a row.
+        results = self.client.query(
+            collection_name=self.config.collection_name, filter=filter_, output_fields=["id", "metadata"]
+        )
         for res in results:
             data_ids.append(res.get("id"))
             metadatas.append(res.get("metadata", {}))
@@ -128,13 +134,15 @@ class ZillizVectorDB(BaseVectorDB):
         """Add to database"""
         embeddings = self.embedder.embedding_fn(documents)
 
-        for id, doc, metadata, embedding in zip(ids, documents, metadatas, embeddings):
-            data = {"id": id, "text": doc, "embeddings": embedding, "metadata": metadata}
-            self.client.insert(collection_name=self.config.collection_name, data=data, **kwargs)
+        rows = [
+            {"id": id, "text": doc, "embeddings": embedding, "metadata": metadata}
+            for id, doc, metadata, embedding in zip(ids, documents, metadatas, embeddings)
+        ]
+        for chunk in chunks(rows, self.BATCH_SIZE, desc="Inserting batches in zilliz"):
+            self.client.insert(collection_name=self.config.collection_name, data=list(chunk), **kwargs)
 
         self.collection.load()
         self.collection.flush()
-        self.client.flush(self.config.collection_name)
 
     def query(
         self,
@@ -164,9 +172,8 @@ class ZillizVectorDB(BaseVectorDB):
         if self.collection.is_empty:
             return []
 
-        output_fields = ["*"]
-        input_query_vector = self.embedder.embedding_fn([input_query])
-        query_vector = input_query_vector[0]
+        output_fields = ["text", "metadata"]
+        query_vector = self.embedder.to_embeddings(input_query)
 
         query_filter = self._generate_zilliz_filter(where)
         query_result = self.client.search(
@@ -233,13 +240,11 @@ class ZillizVectorDB(BaseVectorDB):
 
     def delete(self, where: dict[str, Any]):
         """
-        Delete the embeddings from DB. Zilliz only support deleting with keys.
+        Delete the embeddings matching the filter from DB.
 
+        The filter is evaluated by Zilliz, so the entries don't have to be fetched first to look up their keys.
 
-        :param keys: Primary keys of the table entries to delete.
-        :type keys: Union[list, str, int]
+        :param where: to filter data
+        :type where: dict[str, Any]
         """
-        data = self.get(where=where)
-        keys = data.get("ids", [])
-        if keys:
-            self.client.delete(collection_name=self.config.collection_name, pks=keys)
+        self.client.delete(collection_name=self.config.collection_name, filter=self._generate_zilliz_filter(where))
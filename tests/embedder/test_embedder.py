@@ -47,3 +47,21 @@ def test_set_vector_dimension_type_error(base_embedder):
 def test_embedder_with_config():
     embedder = BaseEmbedder(BaseEmbedderConfig())
     assert isinstance(embedder.config, BaseEmbedderConfig)
+
+
+def test_to_embeddings_caches_repeated_strings(base_embedder):
+    calls = []
+
+    def embedding_function(texts: Documents) -> Embeddings:
+        calls.extend(texts)
+        return [[float(len(text))] for text in texts]
+
+    base_embedder.set_embedding_fn(embedding_function)
+    assert base_embedder.to_embeddings("text") == [4.0]
+    assert base_embedder.to_embeddings("text") == [4.0]
+    assert calls == ["text"]
+
+    # Setting a new embedding function invalidates the cached embeddings.
+    base_embedder.set_embedding_fn(embedding_function)
+    base_embedder.to_embeddings("text")
+    assert calls == ["text", "text"]
@@ -119,6 +119,19 @@ def test_generate_embedding(mock_answer_relevance_metric, mock_data, monkeypatch
     assert len(embedding) == 3
 
 
+def test_generate_embeddings(mock_answer_relevance_metric, monkeypatch):
+    calls = []
+
+    def mock_create(input, model):
+        calls.append(input)
+        return type("obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]}) for _ in input]})()
+
+    monkeypatch.setattr(mock_answer_relevance_metric.client.embeddings, "create", mock_create)
+    embeddings = mock_answer_relevance_metric._generate_embeddings(["question 1?", "question 2?", "question 3?"])
+    assert embeddings.shape == (3, 3)
+    assert calls == [["question 1?", "question 2?", "question 3?"]]
+
+
 def test_compute_similarity(mock_answer_relevance_metric, mock_data):
     original = np.array([1, 2, 3])
     generated = np.array([[1, 2, 3], [1, 2, 3]])
@@ -149,7 +162,9 @@ def test_compute_score(mock_answer_relevance_metric, mock_data, monkeypatch):
     monkeypatch.setattr(
         mock_answer_relevance_metric.client.embeddings,
         "create",
-        lambda input, model: type("obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]})]})(),
+        lambda input, model: type(
+            "obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]}) for _ in input]}
+        )(),
     )
     score = mock_answer_relevance_metric._compute_score(mock_data[0])
     assert score == 1.0
@@ -170,7 +185,9 @@ def test_compute_score(mock_answer_relevance_metric, mock_data, monkeypatch):
     monkeypatch.setattr(
         mock_answer_relevance_metric.client.embeddings,
         "create",
-        lambda input, model: type("obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]})]})(),
+        lambda input, model: type(
+            "obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]}) for _ in input]}
+        )(),
     )
     score = mock_answer_relevance_metric._compute_score(mock_data[1])
     assert score == 1.0
@@ -197,7 +214,9 @@ def test_evaluate(mock_answer_relevance_metric, mock_data, monkeypatch):
     monkeypatch.setattr(
         mock_answer_relevance_metric.client.embeddings,
         "create",
-        lambda input, model: type("obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]})]})(),
+        lambda input, model: type(
+            "obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]}) for _ in input]}
+        )(),
     )
     score = mock_answer_relevance_metric.evaluate(mock_data)
     assert score == 1.0
@@ -218,7 +237,9 @@ def test_evaluate(mock_answer_relevance_metric, mock_data, monkeypatch):
     monkeypatch.setattr(
         mock_answer_relevance_metric.client.embeddings,
         "create",
-        lambda input, model: type("obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]})]})(),
+        lambda input, model: type(
+            "obj", (object,), {"data": [type("obj", (object,), {"embedding": [1, 2, 3]}) for _ in input]}
+        )(),
     )
     score = mock_answer_relevance_metric.evaluate(mock_data)
     assert score == 1.0
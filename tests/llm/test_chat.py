@@ -118,3 +118,18 @@ class TestApp(unittest.TestCase):
         assert "app_id" in where
         assert "attribute" in where
         mock_answer.assert_called_once()
+
+    @patch("chromadb.api.models.Collection.Collection.add", MagicMock)
+    def test_chat_online_searches_web_once(self):
+        with patch.object(self.app, "_retrieve_from_database") as mock_retrieve:
+            mock_retrieve.return_value = ["Test context"]
+            with patch.object(self.app.llm, "access_search_and_get_results") as mock_search:
+                mock_search.return_value = "Test search result"
+                with patch.object(self.app.llm, "get_llm_model_answer") as mock_answer:
+                    mock_answer.return_value = "Test answer"
+                    answer = self.app.chat("Test query", BaseLlmConfig(online=True))
+
+        self.assertEqual(answer, "Test answer")
+        mock_retrieve.assert_called_once()
+        mock_search.assert_called_once_with("Test query")
+        self.assertIn("Test search result", mock_answer.call_args.args[0])
@@ -77,3 +77,33 @@ def test_query_with_where_in_query_config(app):
     assert "app_id" in where
     assert "attribute" in where
     mock_answer.assert_called_once()
+
+
+@patch("chromadb.api.models.Collection.Collection.add", MagicMock)
+def test_query_online_searches_web_once(app):
+    with patch.object(app, "_retrieve_from_database") as mock_retrieve:
+        mock_retrieve.return_value = ["Test context"]
+        with patch.object(app.llm, "access_search_and_get_results") as mock_search:
+            mock_search.return_value = "Test search result"
+            with patch.object(app.llm, "get_llm_model_answer") as mock_answer:
+                mock_answer.return_value = "Test answer"
+                answer = app.query("Test query", BaseLlmConfig(online=True))
+
+    assert answer == "Test answer"
+    mock_retrieve.assert_called_once()
+    mock_search.assert_called_once_with("Test query")
+    prompt = mock_answer.call_args.args[0]
+    assert "Test search result" in prompt
+
+
+def test_retrieve_with_cache_leaves_web_search_to_llm(app):
+    # With the cache enabled, the web search must not run before the cache is checked
+    app.cache_config = MagicMock()
+    with patch.object(app, "_retrieve_from_database") as mock_retrieve:
+        mock_retrieve.return_value = ["Test context"]
+        with patch.object(app.llm, "access_search_and_get_results") as mock_search:
+            contexts, web_search_result = app._retrieve_with_web_search("Test query", BaseLlmConfig(online=True))
+
+    assert contexts == ["Test context"]
+    assert web_search_result is None
+    mock_search.assert_not_called()
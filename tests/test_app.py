@@ -5,6 +5,7 @@ import yaml
 
 from embedchain import App
 from embedchain.config import ChromaDbConfig
+from embedchain.core.db.models import DataSource
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.llm.base import BaseLlm
 from embedchain.vectordb.base import BaseVectorDB
@@ -109,3 +110,62 @@ class TestAppFromConfig:
         # Validate the Embedder config values
         embedder_config = config_data["embedder"]["config"]
         assert app.embedding_model.config.deployment_name == embedder_config["deployment_name"]
+
+
+class TestAppDeploy:
+    @pytest.fixture
+    def app_with_data_sources(self, app, mocker):
+        app.client = mocker.Mock()
+        mocker.patch.object(app, "_create_pipeline", return_value={"id": "pipeline-id"})
+        for data_hash, value in [("hash_1", "text 1"), ("hash_2", "text 2"), ("hash_3", "text 3")]:
+            app.db_session.add(DataSource(hash=data_hash, app_id=app.local_id, type="text", value=value))
+        app.db_session.commit()
+        return app
+
+    def _uploaded_hashes(self, app):
+        rows = app.db_session.query(DataSource.hash).filter_by(app_id=app.local_id, is_uploaded=1)
+        return sorted(data_hash for (data_hash,) in rows)
+
+    def test_deploy(self, app_with_data_sources, mocker):
+        app = app_with_data_sources
+        mock_upload = mocker.patch.object(app, "_upload_data_to_pipeline")
+        mock_mark = mocker.spy(app, "_mark_data_as_uploaded")
+
+        app.deploy()
+
+        assert [c.args[:2] for c in mock_upload.call_args_list] == [
+            ("text", "text 1"),
+            ("text", "text 2"),
+            ("text", "text 3"),
+        ]
+        # All data sources are marked with a single update
+        mock_mark.assert_called_once_with(["hash_1", "hash_2", "hash_3"])
+        assert self._uploaded_hashes(app) == ["hash_1", "hash_2", "hash_3"]
+
+        # Uploaded data sources are not uploaded again
+        mock_upload.reset_mock()
+        app.deploy()
+        mock_upload.assert_not_called()
+
+    def test_deploy_marks_uploaded_data_when_an_upload_raises(self, app_with_data_sources, mocker):
+        app = app_with_data_sources
+        mocker.patch.object(app, "_process_and_upload_data", side_effect=[True, Exception("upload failed")])
+
+        with pytest.raises(Exception, match="upload failed"):
+            app.deploy()
+
+        assert self._uploaded_hashes(app) == ["hash_1"]
+
+    def test_mark_data_as_uploaded(self, app_with_data_sources):
+        app = app_with_data_sources
+        app._mark_data_as_uploaded(["hash_1", "hash_3"])
+        assert self._uploaded_hashes(app) == ["hash_1", "hash_3"]
+
+    def test_mark_data_as_uploaded_rolls_back_on_error(self, app_with_data_sources, mocker):
+        app = app_with_data_sources
+        mocker.patch.object(app.db_session, "commit", side_effect=Exception("commit failed"))
+        mock_rollback = mocker.spy(app.db_session, "rollback")
+
+        app._mark_data_as_uploaded(["hash_1"])
+
+        mock_rollback.assert_called_once()
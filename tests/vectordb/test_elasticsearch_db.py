@@ -2,8 +2,11 @@ import os
 import unittest
 from unittest.mock import patch
 
+import pytest
+
 from embedchain import App
 from embedchain.config import AppConfig, ElasticsearchDBConfig
+from embedchain.embedder.base import BaseEmbedder
 from embedchain.embedder.gpt4all import GPT4AllEmbedder
 from embedchain.vectordb.elasticsearch import ElasticsearchDB
 
@@ -56,6 +59,9 @@ class TestEsDB(unittest.TestCase):
 
         # Configure the mock client to return the mocked response.
         mock_client.return_value.search.return_value = search_response
+        mock_client.return_value.indices.get_mapping.return_value = {
+            "es_index": {"mappings": {"properties": {"embeddings": {"type": "dense_vector", "index": True}}}}
+        }
 
         # Query the database for the documents that are most similar to the query "This is a document".
         query = ["This is a document"]
@@ -70,6 +76,92 @@ class TestEsDB(unittest.TestCase):
         ]
         self.assertEqual(results_with_citations, expected_results_with_citations)
 
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_query_with_vector_index(self, mock_client):
+        mock_client.return_value.indices.exists.return_value = False
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200"))
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(3)
+        embedder.set_embedding_fn(lambda texts: [[1, 2, 3] for _ in texts])
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=embedder)
+
+        index_body = mock_client.return_value.indices.create.call_args.kwargs["body"]
+        self.assertTrue(index_body["mappings"]["properties"]["embeddings"]["index"])
+        self.assertEqual(index_body["mappings"]["properties"]["embeddings"]["similarity"], "dot_product")
+
+        mock_client.return_value.search.return_value = {"hits": {"hits": []}}
+        self.db.query(["This is a document"], n_results=2, where={"app_id": "app"})
+
+        search_kwargs = mock_client.return_value.search.call_args.kwargs
+        self.assertNotIn("query", search_kwargs)
+        self.assertEqual(search_kwargs["knn"]["k"], 2)
+        # The query vector is normalized like the stored embeddings
+        self.assertEqual(search_kwargs["knn"]["query_vector"], pytest.approx([0.26726, 0.53452, 0.80178], abs=1e-5))
+        self.assertEqual(
+            search_kwargs["knn"]["filter"], {"bool": {"must": [{"term": {"metadata.app_id.keyword": "app"}}]}}
+        )
+
+        # Elasticsearch caps the number of candidates at 10000
+        self.db.query(["This is a document"], n_results=2000, where={})
+        self.assertEqual(mock_client.return_value.search.call_args.kwargs["knn"]["num_candidates"], 10000)
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_index_options(self, mock_client):
+        mock_client.return_value.indices.exists.return_value = False
+        self.db = ElasticsearchDB(
+            config=ElasticsearchDBConfig(es_url="https://localhost:9200", index_options={"type": "int8_hnsw"})
+        )
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(3)
+        embedder.set_embedding_fn(lambda texts: [[1, 2, 3] for _ in texts])
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=embedder)
+
+        index_body = mock_client.return_value.indices.create.call_args.kwargs["body"]
+        self.assertEqual(index_body["mappings"]["properties"]["embeddings"]["index_options"], {"type": "int8_hnsw"})
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_query_after_switching_to_unindexed_collection(self, mock_client):
+        mock_client.return_value.indices.exists.return_value = False
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200"))
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(3)
+        embedder.set_embedding_fn(lambda texts: [[1, 2, 3] for _ in texts])
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=embedder)
+
+        # An index created by an older version, without a vector index on the embeddings
+        mock_client.return_value.indices.get_mapping.return_value = {
+            "old_index_3": {"mappings": {"properties": {"embeddings": {"type": "dense_vector", "index": False}}}}
+        }
+        self.db.set_collection_name("old_index")
+        mock_client.return_value.search.return_value = {"hits": {"hits": []}}
+        self.db.query(["This is a document"], n_results=2, where={})
+
+        search_kwargs = mock_client.return_value.search.call_args.kwargs
+        self.assertEqual(search_kwargs["index"], "old_index_3")
+        self.assertNotIn("knn", search_kwargs)
+        self.assertIn("script_score", search_kwargs["query"])
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_query_on_aliased_collection(self, mock_client):
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200"))
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(3)
+        embedder.set_embedding_fn(lambda texts: [[1, 2, 3] for _ in texts])
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=embedder)
+
+        # The mapping of an alias is returned under the name of the index it points to
+        mock_client.return_value.indices.get_mapping.return_value = {
+            "es_index_v2": {"mappings": {"properties": {"embeddings": {"type": "dense_vector", "index": True}}}}
+        }
+        mock_client.return_value.search.return_value = {"hits": {"hits": []}}
+        self.db.query(["This is a document"], n_results=2, where={})
+
+        self.assertIn("knn", mock_client.return_value.search.call_args.kwargs)
+
     def test_init_without_url(self):
         # Make sure it's not loaded from env
         try:
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+from embedchain.config import OpenSearchDBConfig
+from embedchain.vectordb.opensearch import OpenSearchDB
+
+
+@patch("embedchain.vectordb.opensearch.OpenAIEmbeddings")
+@patch("embedchain.vectordb.opensearch.OpenSearchVectorSearch")
+@patch("embedchain.vectordb.opensearch.OpenSearch")
+class TestOpenSearchDB(unittest.TestCase):
+    def _create_db(self):
+        db = OpenSearchDB(
+            config=OpenSearchDBConfig(
+                opensearch_url="https://localhost:9200", http_auth=("admin", "admin"), collection_name="my-app"
+            )
+        )
+        db._initialize()
+        return db
+
+    def test_query_on_new_index(self, mock_client, mock_docsearch, _):
+        mock_client.return_value.indices.exists.return_value = False
+        db = self._create_db()
+
+        index_body = mock_client.return_value.indices.create.call_args.kwargs["body"]
+        self.assertEqual(
+            index_body["mappings"]["properties"]["embeddings"]["method"],
+            {"name": "hnsw", "space_type": "cosinesimil", "engine": "lucene"},
+        )
+
+        mock_docsearch.return_value.similarity_search_with_score.return_value = []
+        db.query(["This is a document"], n_results=2, where={})
+
+        search_kwargs = mock_docsearch.return_value.similarity_search_with_score.call_args.kwargs
+        self.assertEqual(search_kwargs["search_type"], "approximate_search")
+        self.assertNotIn("efficient_filter", search_kwargs)
+        self.assertNotIn("pre_filter", search_kwargs)
+        mock_client.return_value.indices.get_mapping.assert_not_called()
+
+    def test_query_with_filter(self, mock_client, mock_docsearch, _):
+        mock_client.return_value.indices.exists.return_value = False
+        db = self._create_db()
+
+        mock_docsearch.return_value.similarity_search_with_score.return_value = []
+        db.query(["This is a document"], n_results=2, where={"app_id": "app"})
+
+        search_kwargs = mock_docsearch.return_value.similarity_search_with_score.call_args.kwargs
+        self.assertEqual(search_kwargs["search_type"], "approximate_search")
+        self.assertEqual(
+            search_kwargs["efficient_filter"], {"bool": {"must": [{"term": {"metadata.app_id.keyword": "app"}}]}}
+        )
+
+    def test_query_on_legacy_index(self, mock_client, mock_docsearch, _):
+        mock_client.return_value.indices.exists.return_value = True
+        # An index created by an older version, whose embeddings have no HNSW graph.
+        # The mapping of an alias is returned under the name of the index it points to.
+        mock_client.return_value.indices.get_mapping.return_value = {
+            "my-app-v1": {"mappings": {"properties": {"embeddings": {"type": "knn_vector", "dimension": 1536}}}}
+        }
+        db = self._create_db()
+        mock_client.return_value.indices.create.assert_not_called()
+
+        mock_docsearch.return_value.similarity_search_with_score.return_value = []
+        db.query(["This is a document"], n_results=2, where={})
+
+        search_kwargs = mock_docsearch.return_value.similarity_search_with_score.call_args.kwargs
+        self.assertEqual(search_kwargs["search_type"], "script_scoring")
+        self.assertEqual(search_kwargs["space_type"], "cosinesimil")
+        self.assertEqual(search_kwargs["pre_filter"], {"match_all": {}})
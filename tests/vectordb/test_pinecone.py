@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from embedchain.config.vectordb.pinecone import PineconeDBConfig
@@ -150,6 +152,9 @@ class MockEmbedder:
     def embedding_fn(self, documents):
         return [[1, 1, 1] for d in documents]
 
+    def to_embeddings(self, data):
+        return self.embedding_fn([data])[0]
+
 
 def test_setup_pinecone_index(pinecone_pod_config, pinecone_serverless_config, monkeypatch):
     monkeypatch.setattr("embedchain.vectordb.pinecone.pinecone", MockPinecone)
@@ -185,6 +190,31 @@ def test_get(monkeypatch):
     assert ids == {"ids": ["key_1", "key_2"], "metadatas": [{"source": "1"}, {"source": "2"}]}
 
 
+class MockBatchedPineconeIndex:
+    def __init__(self):
+        self.fetched_batches = []
+
+    def fetch(self, ids, **kwargs):
+        self.fetched_batches.append(ids)
+        # Make the earlier batches finish last
+        time.sleep(0.01 * (3 - len(self.fetched_batches)))
+        return {"vectors": {id: {"metadata": {"source": id}} for id in ids}}
+
+
+def test_get_in_batches(monkeypatch):
+    monkeypatch.setenv("PINECONE_API_KEY", "test_api_key")
+    monkeypatch.setattr("embedchain.vectordb.pinecone.PineconeDB._setup_pinecone_index", lambda x: x)
+    monkeypatch.setattr("embedchain.vectordb.pinecone.PineconeDB._get_or_create_db", lambda x: x)
+    pinecone_db = PineconeDB()
+    pinecone_db.pinecone_index = MockBatchedPineconeIndex()
+
+    ids = [f"key_{i}" for i in range(250)]
+    result = pinecone_db.get(ids)
+
+    assert sorted(len(batch) for batch in pinecone_db.pinecone_index.fetched_batches) == [50, 100, 100]
+    assert result == {"ids": ids, "metadatas": [{"source": id} for id in ids]}
+
+
 def test_add(monkeypatch):
     def mock_pinecone_db():
         monkeypatch.setenv("PINECONE_API_KEY", "test_api_key")
@@ -223,3 +253,31 @@ def test_query(monkeypatch):
         ("text_1", {"key": "value", "text": "text_1", "score": 0.1}),
         ("text_2", {"key": "value", "text": "text_2", "score": 0.2}),
     ]
+
+
+class MockBM25Encoder:
+    def __init__(self):
+        self.calls = []
+
+    def encode_documents(self, texts):
+        self.calls.append(texts)
+        return [{"indices": [i], "values": [1.0]} for i, _ in enumerate(texts)]
+
+
+def test_add_with_sparse_vectors(monkeypatch):
+    monkeypatch.setenv("PINECONE_API_KEY", "test_api_key")
+    monkeypatch.setattr("embedchain.vectordb.pinecone.PineconeDB._setup_pinecone_index", lambda x: x)
+    monkeypatch.setattr("embedchain.vectordb.pinecone.PineconeDB._get_or_create_db", lambda x: x)
+    pinecone_db = PineconeDB()
+    pinecone_db.pinecone_index = MockPineconeIndex()
+    pinecone_db._set_embedder(MockEmbedder())
+    pinecone_db.bm25_encoder = MockBM25Encoder()
+
+    pinecone_db.add(["text_5", "text_6"], [{"key_5": "value_5"}, {"key_6": "value_6"}], ["key_5", "key_6"])
+
+    # All documents are encoded with a single call
+    assert pinecone_db.bm25_encoder.calls == [["text_5", "text_6"]]
+    assert [doc["sparse_values"] for doc in pinecone_db.pinecone_index.db[-2:]] == [
+        {"indices": [0], "values": [1.0]},
+        {"indices": [1], "values": [1.0]},
+    ]
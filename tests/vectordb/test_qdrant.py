@@ -41,6 +41,11 @@ class TestQdrantDB(unittest.TestCase):
         self.assertEqual(db.collection_name, "embedchain-store-1536")
         self.assertEqual(db.client, qdrant_client_mock.return_value)
         qdrant_client_mock.return_value.get_collections.assert_called_once()
+        qdrant_client_mock.return_value.create_payload_index.assert_any_call(
+            collection_name="embedchain-store-1536",
+            field_name="metadata.doc_id",
+            field_schema=models.PayloadSchemaType.KEYWORD,
+        )
 
     @patch("embedchain.vectordb.qdrant.QdrantClient")
     def test_get(self, qdrant_client_mock):
@@ -61,6 +66,44 @@ class TestQdrantDB(unittest.TestCase):
         resp2 = db.get(ids=["123", "456"], where={"url": "https://ai.ai"})
         self.assertEqual(resp2, {"ids": [], "metadatas": []})
 
+    @patch("embedchain.vectordb.qdrant.QdrantClient")
+    def test_get_fetches_all_ids_in_one_request(self, qdrant_client_mock):
+        qdrant_client_mock.return_value.scroll.return_value = ([], None)
+
+        # Set the embedder
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(1536)
+        embedder.set_embedding_fn(mock_embedding_fn)
+
+        # Create a Qdrant instance
+        db = QdrantDB()
+        app_config = AppConfig(collect_metrics=False)
+        App(config=app_config, db=db, embedding_model=embedder)
+
+        ids = [str(i) for i in range(50)]
+        db.get(ids=ids)
+        qdrant_client_mock.return_value.scroll.assert_called_once()
+        self.assertEqual(qdrant_client_mock.return_value.scroll.call_args.kwargs["limit"], 50)
+
+    @patch("embedchain.vectordb.qdrant.QdrantClient")
+    def test_get_with_limit(self, qdrant_client_mock):
+        points = [models.Record(id=i, payload={"identifier": str(i), "metadata": {"doc_id": "doc"}}) for i in range(2)]
+        qdrant_client_mock.return_value.scroll.return_value = (points, "next-page")
+
+        # Set the embedder
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(1536)
+        embedder.set_embedding_fn(mock_embedding_fn)
+
+        # Create a Qdrant instance
+        db = QdrantDB()
+        app_config = AppConfig(collect_metrics=False)
+        App(config=app_config, db=db, embedding_model=embedder)
+
+        resp = db.get(where={"doc_id": "doc"}, limit=1)
+        self.assertEqual(resp, {"ids": ["0"], "metadatas": [{"doc_id": "doc"}]})
+        qdrant_client_mock.return_value.scroll.assert_called_once()
+
     @pytest.mark.skip(reason="Investigate the issue with the test case.")
     @patch("embedchain.vectordb.qdrant.QdrantClient")
     @patch.object(uuid, "uuid4", side_effect=TEST_UUIDS)
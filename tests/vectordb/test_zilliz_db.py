@@ -123,7 +123,7 @@ class TestZillizDBCollection:
         # Mock the MilvusClient search method
         with patch.object(zilliz_db.client, "search") as mock_search:
             # Mock the embedding function
-            mock_embedder.embedding_fn.return_value = ["query_vector"]
+            mock_embedder.to_embeddings.return_value = "query_vector"
 
             # Mock the search result
             mock_search.return_value = [
@@ -147,7 +147,7 @@ class TestZillizDBCollection:
                 data=["query_vector"],
                 filter="",
                 limit=1,
-                output_fields=["*"],
+                output_fields=["text", "metadata"],
             )
 
             # Assert that the query result matches the expected result
@@ -162,7 +162,47 @@ class TestZillizDBCollection:
                 data=["query_vector"],
                 filter="",
                 limit=1,
-                output_fields=["*"],
+                output_fields=["text", "metadata"],
             )
 
             assert query_result_with_citations == [("result_doc", {"url": "url_1", "doc_id": "doc_id_1", "score": 0.0})]
+
+    @patch("embedchain.vectordb.zilliz.MilvusClient", autospec=True)
+    @patch("embedchain.vectordb.zilliz.connections", autospec=True)
+    def test_delete(self, mock_connect, mock_client, mock_config):
+        zilliz_db = ZillizVectorDB(config=mock_config)
+
+        with patch.object(zilliz_db.client, "delete") as mock_delete, patch.object(
+            zilliz_db.client, "query"
+        ) as mock_query:
+            zilliz_db.delete(where={"doc_id": "doc_id_1"})
+
+            # The entries are deleted with a single filtered request, without querying for their ids first.
+            mock_query.assert_not_called()
+            mock_delete.assert_called_once_with(
+                collection_name=mock_config.collection_name, filter='(metadata["doc_id"] == "doc_id_1")'
+            )
+
+    @patch("embedchain.vectordb.zilliz.MilvusClient", autospec=True)
+    @patch("embedchain.vectordb.zilliz.connections", autospec=True)
+    def test_add(self, mock_connect, mock_client, mock_embedder, mock_config):
+        zilliz_db = ZillizVectorDB(config=mock_config)
+        zilliz_db.embedder = mock_embedder
+        zilliz_db.collection = Mock()
+        mock_embedder.embedding_fn.return_value = [[1, 2, 3], [4, 5, 6]]
+
+        with patch.object(zilliz_db.client, "insert") as mock_insert:
+            zilliz_db.add(
+                documents=["doc_1", "doc_2"],
+                metadatas=[{"doc_id": "doc_id_1"}, {"doc_id": "doc_id_2"}],
+                ids=["id_1", "id_2"],
+            )
+
+            # All the rows are inserted with a single request.
+            mock_insert.assert_called_once_with(
+                collection_name=mock_config.collection_name,
+                data=[
+                    {"id": "id_1", "text": "doc_1", "embeddings": [1, 2, 3], "metadata": {"doc_id": "doc_id_1"}},
+                    {"id": "id_2", "text": "doc_2", "embeddings": [4, 5, 6], "metadata": {"doc_id": "doc_id_2"}},
+                ],
+            )